@@ -1,10 +1,18 @@
+import csv
 import pandas as pd
+import polars as pl
+import pyarrow as pa
+import pyarrow.csv as pacsv
 from datetime import datetime
+from functools import lru_cache
 import os
 from tabulate import tabulate
 
 FILE = "applications.csv"
 
+# Rows shown per page in the application tables
+PAGE = 50
+
 # Define the columns
 COLUMNS = [
     "Date",
@@ -17,24 +25,130 @@ COLUMNS = [
     "Notes"
 ]
 
-# Initialize CSV if it doesn't exist
-if not os.path.exists(FILE):
-    df = pd.DataFrame(columns=COLUMNS)
-    df.to_csv(FILE, index=False)
-    print(f"{FILE} created successfully with columns: {', '.join(COLUMNS)}")
-else:
-    print(f"{FILE} already exists with columns: {', '.join(COLUMNS)}")
+# Column positions used for scalar lookups with .iat
+_COL_COMPANY = COLUMNS.index("Company")
+_COL_ROLE = COLUMNS.index("Role")
+
+# Known application statuses; Status is loaded as a categorical over these
+STATUSES = ["Applied", "Interview", "Tech Assessment", "Case Study", "Offer", "Rejected"]
+
+# Date columns are parsed to datetime64 once at load; free-text columns are
+# always read as strings, even when empty
+DATE_COLUMNS = ["Date", "Follow-up Date"]
+DTYPES = {col: "str" for col in COLUMNS if col not in DATE_COLUMNS}
+
+# Arrow schema used when rewriting FILE: every column is written back as the
+# text that was read, so hand-edited cells survive a rewrite unchanged
+SCHEMA = pa.schema([(col, pa.string()) for col in COLUMNS])
+
+
+def _ensure_file():
+    """Create FILE with just the header row the first time it is needed."""
+    if not os.path.exists(FILE):
+        pd.DataFrame(columns=COLUMNS).to_csv(FILE, index=False)
+        print(f"{FILE} created successfully with columns: {', '.join(COLUMNS)}")
+
+
+def _as_status_category(status):
+    """Convert a Status column to a categorical over STATUSES plus any other values present."""
+    status = status.astype("category")
+    extra = [value for value in status.cat.categories if value not in STATUSES]
+    return status.cat.set_categories(STATUSES + extra)
+
+
+@lru_cache(maxsize=2)
+def _load_df_cached(mtime, size):
+    """Parse FILE; the arguments only key the cache. Callers must not modify the result."""
+    df = pd.read_csv(FILE, engine="pyarrow", dtype=DTYPES)
+    for col in DATE_COLUMNS:
+        df[col] = pd.to_datetime(df[col], format='mixed', errors='coerce')
+    df['Status'] = _as_status_category(df['Status'])
+    return df
+
+
+def _load_df():
+    """Return the applications DataFrame, re-reading FILE only if it changed on disk."""
+    _ensure_file()
+    file_stat = os.stat(FILE)
+    return _load_df_cached(file_stat.st_mtime, file_stat.st_size)
+
+
+def _load_raw():
+    """Read FILE with every cell as its original text, for rewriting it; the parsed cache is only for reads."""
+    _ensure_file()
+    return pd.read_csv(FILE, dtype=str, keep_default_na=False)
+
+
+def _save_df(df):
+    """Overwrite FILE with df, a frame from _load_raw."""
+    # A parsed frame would turn unreadable dates into empty cells; refuse it
+    if list(df.columns) != COLUMNS or not all(pd.api.types.is_string_dtype(dtype) for dtype in df.dtypes):
+        raise ValueError("_save_df only writes the all-string frame from _load_raw")
+    table = pa.Table.from_pandas(df, schema=SCHEMA, preserve_index=False)
+    pacsv.write_csv(table, FILE, write_options=pacsv.WriteOptions(include_header=True, batch_size=1024))
+
+
+def _missing_final_newline():
+    """Return True if FILE is non-empty and its last byte is not a newline (e.g. after a hand edit)."""
+    with open(FILE, "rb") as f:
+        if f.seek(0, os.SEEK_END) == 0:
+            return False
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) != b"\n"
+
+
+def _append_row(row):
+    """Append a single row (a dict keyed by COLUMNS) to FILE without rewriting it."""
+    _ensure_file()
+    missing_newline = _missing_final_newline()
+    with open(FILE, "a", newline="") as f:
+        # Otherwise the new row would be glued onto the last line
+        if missing_newline:
+            f.write("\n")
+        csv.DictWriter(f, fieldnames=COLUMNS, lineterminator="\n").writerow(row)
+
+
+def _scan():
+    """Lazily scan FILE with Polars, so queries only materialize the columns and rows they use."""
+    _ensure_file()
+    return pl.scan_csv(FILE, infer_schema_length=0).with_columns(
+        pl.col(col).str.to_date(strict=False) for col in DATE_COLUMNS
+    )
+
+
+def _for_display(df):
+    """Format the date columns as plain YYYY-MM-DD strings for tabulate."""
+    df = df.copy()
+    for col in DATE_COLUMNS:
+        df[col] = df[col].dt.strftime("%Y-%m-%d").fillna("")
+    return df
+
+
+def _choose_page(df):
+    """Ask which page of df to show if it spans several; return (start, rows on that page)."""
+    pages = (len(df) - 1) // PAGE + 1
+    page = 1
+    if pages > 1:
+        answer = input(f"Page number 1-{pages} (enter for 1): ").strip()
+        if answer:
+            try:
+                page = min(max(int(answer), 1), pages)
+            except ValueError:
+                print("Invalid page number! Showing page 1.")
+    start = (page - 1) * PAGE
+    return start, df.iloc[start:start + PAGE]
 
 
 def view_applications():
     """View all job applications."""
-    df = pd.read_csv(FILE)
+    df = _load_df()
     if df.empty:
         print("\nNo applications found.\n")
         return
     
     print("\n=== All Job Applications ===")
-    print(tabulate(df, headers='keys', tablefmt='fancy_grid', showindex=[i+1 for i in range(len(df))]))
+    start, page = _choose_page(df)
+    print(tabulate(_for_display(page), headers='keys', tablefmt='fancy_grid', showindex=range(start + 1, start + len(page) + 1)))
     print("\n============================\n")
 
 
@@ -64,7 +178,6 @@ def add_application():
             follow_up = ""
     notes = input("Notes (optional): ").strip()
     
-    df = pd.read_csv(FILE)
     new_row = {
         "Date": date_applied,
         "Company": company,
@@ -75,39 +188,41 @@ def add_application():
         "Follow-up Date": follow_up,
         "Notes": notes
     }
-    df = pd.concat([df, pd.DataFrame([new_row])], ignore_index=True)
-    df.to_csv(FILE, index=False)
+    _append_row(new_row)
     print(f"\nApplication added: {company} - {role}\n")
 
 
 def follow_ups_pending():
     """Display applications where the follow-up date is today or earlier."""
-    df = pd.read_csv(FILE)
-    if df.empty:
+    lf = _scan()
+    total, pending = pl.collect_all([
+        lf.select(pl.len()),
+        lf.filter(pl.col('Follow-up Date') <= datetime.today().date()),
+    ])
+    if total.item() == 0:
         print("\nNo applications found.\n")
         return
     
-    df['Follow-up Date'] = pd.to_datetime(df['Follow-up Date'], errors='coerce')
-    today = pd.to_datetime(datetime.today().date())
-    pending = df[df['Follow-up Date'] <= today]
-    
+    pending = pending.to_pandas()
     if pending.empty:
         print("\nNo follow-ups pending today.\n")
         return
     
     print("\n=== Follow-ups Pending ===")
-    print(tabulate(pending, headers='keys', tablefmt='fancy_grid', showindex=[i+1 for i in range(len(pending))]))
+    start, page = _choose_page(pending)
+    print(tabulate(_for_display(page), headers='keys', tablefmt='fancy_grid', showindex=range(start + 1, start + len(page) + 1)))
     print("\n============================\n")
 
 def delete_application():
     """Delete a job application by selecting its displayed number."""
-    df = pd.read_csv(FILE)
+    df = _load_df()
     if df.empty:
         print("\nNo applications found.\n")
         return
 
     print("\n=== All Job Applications ===")
-    print(tabulate(df, headers='keys', tablefmt='fancy_grid', showindex=[i+1 for i in range(len(df))]))
+    start, page = _choose_page(df)
+    print(tabulate(_for_display(page), headers='keys', tablefmt='fancy_grid', showindex=range(start + 1, start + len(page) + 1)))
 
     try:
         # Subtract 1 to match zero-based pandas index
@@ -119,42 +234,62 @@ def delete_application():
         print("Invalid input. Please enter a number.")
         return
 
-    confirm = input(f"Are you sure you want to delete '{df.loc[idx, 'Company']} - {df.loc[idx, 'Role']}'? (y/n): ").strip().lower()
+    company, role = df.iat[idx, _COL_COMPANY], df.iat[idx, _COL_ROLE]
+    confirm = input(f"Are you sure you want to delete '{company} - {role}'? (y/n): ").strip().lower()
     if confirm == 'y':
-        df = df.drop(idx).reset_index(drop=True)
-        df.to_csv(FILE, index=False)
+        # Drop the row from the raw text, not the parsed frame, so no cell is rewritten
+        _save_df(_load_raw().drop(idx))
         print("\nApplication deleted successfully.\n")
     else:
         print("\nDeletion cancelled.\n")
    
 
 
+@lru_cache(maxsize=4)
+def _stats(mtime, size, today):
+    """Compute the summary numbers for one version of FILE; the arguments only key the cache."""
+    lf = _scan()
+    # The streaming engine reads FILE in fixed-size chunks and folds each one
+    # into the running aggregates, so memory stays bounded however big it gets
+    summary, counts = pl.collect_all([
+        lf.select(
+            pl.len().alias("total"),
+            (pl.col('Follow-up Date') <= today).sum().alias("pending"),
+        ),
+        lf.drop_nulls('Status').group_by('Status').len().sort("len", descending=True),
+    ], engine="streaming")
+    return {
+        "counts": pd.Series(counts["len"].to_list(), index=counts['Status'].to_list()),
+        "total": summary["total"].item(),
+        "pending": summary["pending"].item(),
+    }
+
+
 def application_stats():
     """Show summary statistics of applications, including conversion ratios and pending follow-ups."""
-    df = pd.read_csv(FILE)
-    if df.empty:
+    _ensure_file()
+    file_stat = os.stat(FILE)
+    stats = _stats(file_stat.st_mtime, file_stat.st_size, datetime.today().date())
+    total = stats["total"]
+    if total == 0:
         print("\nNo applications found.\n")
         return
 
     # Status counts and percentages
-    status_counts = df['Status'].value_counts()
-    total = len(df)
-    stats_table = [[status, count, f"{(count / total * 100):.1f}%"] for status, count in status_counts.items()]
+    status_counts = stats["counts"]
+    percentages = status_counts * (100.0 / total)
+    stats_table = list(zip(status_counts.index, status_counts.to_numpy(), percentages.map("{:.1f}%".format)))
 
     print("\n=== Application Stats ===")
     print(tabulate(stats_table, headers=["Status", "Count", "Percentage"], tablefmt="fancy_grid"))
 
     # Conversion ratios
-    apps_to_interview = (status_counts.get("Interview", 0) / total) * 100
-    apps_to_offer = (status_counts.get("Offer", 0) / total) * 100
+    apps_to_interview, apps_to_offer = percentages.reindex(["Interview", "Offer"], fill_value=0)
     print(f"\nApplications → Interview: {apps_to_interview:.1f}%")
     print(f"Applications → Offer: {apps_to_offer:.1f}%")
 
     # Pending follow-ups
-    df['Follow-up Date'] = pd.to_datetime(df['Follow-up Date'], errors='coerce')
-    today = pd.to_datetime(datetime.today().date())
-    pending = df[df['Follow-up Date'] <= today]
-    print(f"Follow-ups pending today or earlier: {len(pending)}")
+    print(f"Follow-ups pending today or earlier: {stats['pending']}")
 
     print(f"\nTotal Applications: {total}")
     print("==========================\n")
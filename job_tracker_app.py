@@ -1,4 +1,7 @@
+import csv
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
 from datetime import datetime
 import os
 import streamlit as st
@@ -6,6 +9,9 @@ import streamlit as st
 # ---------- CONFIG ----------
 FILE = "applications.csv"
 
+# Rows shown per page in the applications table
+PAGE = 50
+
 COLUMNS = [
     "Date",
     "Company",
@@ -17,12 +23,79 @@ COLUMNS = [
     "Notes"
 ]
 
-# Initialize CSV if it doesn't exist
-if not os.path.exists(FILE):
-    df = pd.DataFrame(columns=COLUMNS)
-    df.to_csv(FILE, index=False)
+# Known application statuses; Status is loaded as a categorical over these
+STATUSES = ["Applied", "Interview", "Tech Assessment", "Case Study", "Offer", "Rejected"]
+
+# Cell styles for the Status column in the applications table
+STATUS_COLORS = {
+    "Applied": "background-color: lightblue",
+    "Interview": "background-color: yellow",
+    "Offer": "background-color: lightgreen",
+    "Rejected": "background-color: lightcoral",
+}
+
+# Date columns are parsed to datetime64 once at load; free-text columns are
+# always read as strings, even when empty
+DATE_COLUMNS = ["Date", "Follow-up Date"]
+DTYPES = {col: "str" for col in COLUMNS if col not in DATE_COLUMNS}
+
+# Arrow schema used when rewriting FILE: every column is written back as the
+# text that was read, so hand-edited cells survive a rewrite unchanged
+SCHEMA = pa.schema([(col, pa.string()) for col in COLUMNS])
 
 # ---------- FUNCTIONS ----------
+# Create the CSV on first use rather than on every script rerun
+def ensure_file():
+    if not os.path.exists(FILE):
+        pd.DataFrame(columns=COLUMNS).to_csv(FILE, index=False)
+
+# True if FILE is non-empty and its last byte is not a newline (e.g. after a hand edit)
+def missing_final_newline():
+    with open(FILE, "rb") as f:
+        if f.seek(0, os.SEEK_END) == 0:
+            return False
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) != b"\n"
+
+# Append just the new row instead of rewriting the whole file
+def append_row(row):
+    ensure_file()
+    missing_newline = missing_final_newline()
+    with open(FILE, "a", newline="") as f:
+        # Otherwise the new row would be glued onto the last line
+        if missing_newline:
+            f.write("\n")
+        csv.DictWriter(f, fieldnames=COLUMNS, lineterminator="\n").writerow(row)
+
+# Categorical over STATUSES, keeping any status typed in through the CLI as an extra category
+def as_status_category(status):
+    status = status.astype("category")
+    extra = [value for value in status.cat.categories if value not in STATUSES]
+    return status.cat.set_categories(STATUSES + extra)
+
+# Streamlit reruns the whole script on every interaction; keying on the file's
+# mtime means the CSV is only parsed again after it actually changes
+@st.cache_data
+def load_df(mtime: float) -> pd.DataFrame:
+    df = pd.read_csv(FILE, engine="pyarrow", dtype=DTYPES)
+    for col in DATE_COLUMNS:
+        df[col] = pd.to_datetime(df[col], format='mixed', errors='coerce')
+    df['Status'] = as_status_category(df['Status'])
+    return df
+
+# Every cell as its original text, for rewriting FILE; load_df is only for reads
+def load_raw():
+    ensure_file()
+    return pd.read_csv(FILE, dtype=str, keep_default_na=False)
+
+def save_df(df):
+    # A parsed frame would turn unreadable dates into empty cells; refuse it
+    if list(df.columns) != COLUMNS or not all(pd.api.types.is_string_dtype(dtype) for dtype in df.dtypes):
+        raise ValueError("save_df only writes the all-string frame from load_raw")
+    table = pa.Table.from_pandas(df, schema=SCHEMA, preserve_index=False)
+    pacsv.write_csv(table, FILE, write_options=pacsv.WriteOptions(include_header=True, batch_size=1024))
+    load_df.clear()
+
 def add_application():
     st.subheader("Add a New Application")
     with st.form("application_form"):
@@ -31,13 +104,12 @@ def add_application():
         role = st.text_input("Role")
         method = st.text_input("Application Method")
         contact = st.text_input("Contact Person (optional)")
-        status = st.selectbox("Status", ["Applied", "Interview", "Tech Assessment", "Case Study", "Offer", "Rejected"])
+        status = st.selectbox("Status", STATUSES)
         follow_up = st.date_input("Follow-up Date", value=None)
         notes = st.text_area("Notes (optional)")
         submitted = st.form_submit_button("Add Application")
         
         if submitted:
-            df = pd.read_csv(FILE)
             new_row = {
                 "Date": date_applied,
                 "Company": company,
@@ -48,84 +120,87 @@ def add_application():
                 "Follow-up Date": follow_up if follow_up else "",
                 "Notes": notes
             }
-            df = pd.concat([df, pd.DataFrame([new_row])], ignore_index=True)
-            df.to_csv(FILE, index=False)
+            append_row(new_row)
+            load_df.clear()
             st.success(f"Application added: {company} - {role}")
 
 def view_applications():
     st.subheader("All Applications")
-    df = pd.read_csv(FILE)
+    ensure_file()
+    df = load_df(os.path.getmtime(FILE))
     
     if df.empty:
         st.info("No applications found. Start by adding a new application.")
         return
 
+    filter_and_show(df)
+
+# Typing in a filter only reruns this fragment, not the whole script
+@st.fragment
+def filter_and_show(df):
     # Filters
     company_filter = st.text_input("Filter by Company")
     status_filter = st.selectbox("Filter by Status", ["All", "Applied", "Interview", "Offer", "Rejected"])
     
-    filtered_df = df.copy()
+    # Combine both filters into one mask so the frame is only indexed once
+    mask = pd.Series(True, index=df.index)
     if company_filter:
-        filtered_df = filtered_df[filtered_df["Company"].str.contains(company_filter, case=False)]
+        # Plain substring match: no regex compile per keystroke, and characters
+        # like "." or "(" in a company name are matched literally
+        mask &= df["Company"].str.contains(company_filter, case=False, regex=False, na=False)
     if status_filter != "All":
-        filtered_df = filtered_df[filtered_df["Status"] == status_filter]
+        mask &= df["Status"] == status_filter
+    filtered_df = df[mask]
     
-    # Color-code statuses
-    def color_status(val):
-        if val == "Applied":
-            return 'background-color: lightblue'
-        elif val == "Interview":
-            return 'background-color: yellow'
-        elif val == "Offer":
-            return 'background-color: lightgreen'
-        elif val == "Rejected":
-            return 'background-color: lightcoral'
-        return ''
-    
-    st.dataframe(filtered_df.style.applymap(color_status, subset=['Status']))
+    # Only style and render one page of rows at a time
+    pages = max((len(filtered_df) - 1) // PAGE + 1, 1)
+    page = st.number_input("Page", min_value=1, max_value=pages, value=1, step=1)
+    start = (page - 1) * PAGE
+    st.dataframe(filtered_df.iloc[start:start + PAGE].style.map(lambda val: STATUS_COLORS.get(val, ''), subset=['Status']))
 
-    # Delete button for each row
-    for idx in filtered_df.index:
-        if st.button(f"Delete Application {idx+1}", key=f"del{idx}"):
-            df = df.drop(idx)
-            df.to_csv(FILE, index=False)
-            st.warning(f"Application {idx + 1} deleted!")
-            st.experimental_rerun()
+    # One selector and button for deletion, however many rows are shown
+    to_delete = st.multiselect(
+        "Applications to delete",
+        filtered_df.index.tolist(),
+        format_func=lambda idx: f"Application {idx + 1}",
+    )
+    if st.button("Delete selected", disabled=not to_delete):
+        # Drop the rows from the raw text, not the parsed frame, so no cell is rewritten
+        save_df(load_raw().drop(to_delete))
+        # A full rerun, so the fragment is handed the reloaded frame
+        st.rerun(scope="app")
 
 def follow_ups_pending():
     st.subheader("Follow-ups Pending")
-    df = pd.read_csv(FILE)
+    ensure_file()
+    df = load_df(os.path.getmtime(FILE))
     if df.empty:
         st.info("No applications found. Add some applications to track follow-ups.")
         return
     
-    df['Follow-up Date'] = pd.to_datetime(df['Follow-up Date'], errors='coerce')
-    today = pd.to_datetime(datetime.today().date())
+    today = pd.Timestamp(datetime.today().date())
     pending = df[df['Follow-up Date'] <= today]
     
     if pending.empty:
         st.info("No follow-ups pending today.")
         return
 
-    # Highlight pending follow-ups
-    def highlight_follow_up(val):
-        if pd.to_datetime(val, errors='coerce') <= today:
-            return 'background-color: orange'
-        return ''
-    
-    st.dataframe(pending.style.applymap(highlight_follow_up, subset=['Follow-up Date']))
+    # Highlight pending follow-ups; the column is already datetime64, so this is a plain comparison
+    st.dataframe(pending.style.map(lambda val: 'background-color: orange' if val <= today else '', subset=['Follow-up Date']))
 
 def application_stats():
     st.subheader("Application Stats")
-    df = pd.read_csv(FILE)
+    ensure_file()
+    df = load_df(os.path.getmtime(FILE))
     if df.empty:
         st.info("No applications found. Add applications to see statistics.")
         return
     
-    status_counts = df['Status'].value_counts()
+    # observed=True: one bincount over the category codes, skipping unused statuses
+    status_counts = df.groupby('Status', observed=True).size()
     total = len(df)
-    for status, count in status_counts.items():
-        percent = (count / total) * 100
+    percentages = status_counts * (100.0 / total)
+    for status, count, percent in zip(status_counts.index, status_counts.to_numpy(), percentages):
         st.write(f"{status}: {count} ({percent:.1f}%)")
     st.write(f"Total Applications: {total}")
 